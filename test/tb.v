@@ -6,8 +6,12 @@
 
 module tb ();
   // Dump the signals to a VCD file. You can view it with gtkwave.
+  // Pass +vcd=<file> to dump to another file, e.g. when running shards side by side.
+  reg [8*64-1:0] vcd_file;
   initial begin
-    $dumpfile("tb.vcd");
+    if (!$value$plusargs("vcd=%s", vcd_file))
+      vcd_file = "tb.vcd";
+    $dumpfile(vcd_file);
     $dumpvars(0, tb);
     #1;
   end
@@ -21,6 +25,11 @@ reg [7:0] uio_in;
 wire [7:0] uo_out;
 wire [7:0] uio_out;
 reg [7:0] uio_oe;
+
+// Free-running 100 MHz clock (10ns period). Generating it here instead of from
+// cocotb means the simulator only calls into Python on edges a test awaits.
+initial clk = 1'b0;
+always #5 clk = ~clk;
 `ifdef GL_TEST
   wire VPWR = 1'b1;
   wire VGND = 1'b0;